@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+ANSI Codes Module for Install Scripts API
+
+This module removes ANSI escape codes and control characters from the
+output of installation scripts, so that task reports contain clean text.
+
+It has no dependencies outside the standard library and can be imported
+without loading the Flask application.
+"""
+
+import re
+from typing import Optional
+
+# Single compiled pattern for everything strip_ansi_codes removes, so that
+# the text is scanned once per call:
+#   - ANSI escape sequences (ESC), and CSI sequences in caret notation
+#     (^[[ or \^[[); a bare caret-bracket is left alone, as in regexes like ^[A-Z]
+#   - caret notation for control characters (^@, ^A, ... ^Z, optionally \-prefixed)
+#   - runs of raw control characters except tab, newline and carriage return
+#     (ESC is kept out of the runs so that a following sequence is still
+#     matched as a whole; a stray ESC is removed on its own)
+# The pattern has no nested or overlapping quantifiers, so the stdlib engine
+# matches it in linear time without backtracking.
+ANSI_STRIP_PATTERN = re.compile(
+    r'\x1B(?:\[[0-?]*[ -/]*[@-~]|[@-Z\\-_])'
+    r'|\\?\^\[\[[0-?]*[ -/]*[@-~]'
+    r'|\\?\^[@A-Z]'
+    r'|[\x00-\x08\x0B\x0C\x0E-\x1A\x1C-\x1F\x7F]+'
+    r'|\x1B'
+)
+
+# Every match of ANSI_STRIP_PATTERN contains a control character (ESC
+# included) or a caret, so text without any of them needs no substitution.
+ANSI_TRIGGER_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F^]')
+
+
+def strip_ansi_codes(text: Optional[str]) -> Optional[str]:
+    """
+    Remove ANSI escape codes and non-printable control characters from text.
+
+    Args:
+        text: Text to clean, may be None
+
+    Returns:
+        Cleaned text, or None if text is None
+    """
+    if text is None:
+        return None
+    # Fast path: most output lines contain nothing to strip
+    if not ANSI_TRIGGER_PATTERN.search(text):
+        return text
+    return ANSI_STRIP_PATTERN.sub('', text)
@@ -10,26 +10,68 @@ Usage:
 Arguments:
     --port PORT  Port to run the server on (default: 5000)
     --host HOST  Host to bind the server to (default: 0.0.0.0)
+
+Production:
+    gunicorn --workers 3 --worker-class gthread --threads 4 --bind 0.0.0.0:5000 app:app
 """
 
 import os
 import re
 import json
+import gzip
 import time
 import argparse
 import logging
 import hashlib
 import shlex
 import threading
-from typing import Optional
-from functools import wraps
+from functools import wraps, lru_cache
 from flask import Flask, jsonify, request
 from dotenv import load_dotenv
 from rate_limiter import RateLimiter
+from ansi_codes import strip_ansi_codes
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Fast JSON libraries - optional, orjson is preferred, then ujson for
+# serialization, with the standard json module as the final fallback.
+# json_dumps() always returns UTF-8 encoded bytes.
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def json_loads(data):
+        # Match orjson: input must be UTF-8 and every parse error,
+        # including a decoding error, is a json.JSONDecodeError
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(f'Invalid UTF-8 ({e.reason})', '', e.start) from e
+        return json.loads(text)
+
+    try:
+        import ujson
+
+        def json_dumps(data):
+            return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+    except ImportError:
+        ujson = None
+
+        def json_dumps(data):
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Brotli - optional, used to pre-compress the scripts list in addition to gzip
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
 # SSH imports - optional, only required for /api/install endpoint
 try:
     import paramiko
@@ -106,13 +148,6 @@ def generate_task_id(script_name, server_ip, server_root_password, additional=''
     return hashlib.md5(data.encode('utf-8')).hexdigest()
 
 
-def strip_ansi_codes(text: Optional[str]) -> Optional[str]:
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    result = ansi_escape.sub('', text)
-
-    return result
-
-
 def escape_shell_args(additional: str) -> str:
     """
     Escape and format additional parameters for shell execution.
@@ -407,85 +442,233 @@ def check_rate_limit(f):
     return decorated_function
 
 
-def get_data_file_path(lang):
+def json_response(data, status=200):
     """
-    Get the path to the data file for the specified language.
-    Falls back to default language (ru) if the requested language file doesn't exist.
+    Build a JSON response serialized with the fastest available JSON library.
 
     Args:
-        lang: Language code (e.g., 'ru', 'en')
+        data: JSON-serializable object, or an already serialized JSON body (bytes)
+        status: HTTP status code (default: 200)
 
     Returns:
-        Path to the data file
+        Flask response with application/json mimetype
     """
-    # Try to get the data file for the requested language
-    data_file = os.path.join(DATA_DIR, f'data_{lang}.json')
-    if os.path.exists(data_file):
-        return data_file
+    body = data if isinstance(data, bytes) else json_dumps(data)
+    return app.response_class(body, status=status, mimetype='application/json')
 
-    # Fall back to default language
-    return os.path.join(DATA_DIR, f'data_{DEFAULT_LANG}.json')
 
-
-@app.route('/api/scripts_list', methods=['GET'])
-@require_api_key
-def scripts_list():
+@lru_cache(maxsize=16)
+def get_data_file_paths(lang):
     """
-    List all scripts from the data file.
+    Get the paths to the data file for the specified language and to the
+    data file for the default language (ru), which is used as a fallback.
 
-    Query Parameters:
-        lang: Language code for the data file (default: 'ru')
-              Falls back to 'ru' if the requested language file doesn't exist.
+    The paths are not checked for existence here; callers open the requested
+    file and fall back to the default one on FileNotFoundError. Results are
+    memoized per language, so DATA_DIR is read on the first call only.
+
+    Args:
+        lang: Language code (e.g., 'ru', 'en')
 
     Returns:
-        JSON response with list of scripts and their details from the data file.
+        tuple: (requested language data file path, default language data file path)
     """
-    try:
-        # Get language from query parameter, default to 'ru'
-        lang = request.args.get('lang', DEFAULT_LANG)
+    return (
+        os.path.join(DATA_DIR, f'data_{lang}.json'),
+        os.path.join(DATA_DIR, f'data_{DEFAULT_LANG}.json')
+    )
 
-        # Get the appropriate data file path
-        data_file_path = get_data_file_path(lang)
 
-        if not os.path.exists(data_file_path):
-            return jsonify({
-                'success': False,
-                'error': 'Data file not found',
-                'scripts': []
-            }), 404
+# In-memory cache of parsed data files, keyed by data file path.
+# An entry is reloaded only when the modification time of its file changes.
+_data_cache = {}
+_data_cache_lock = threading.Lock()
 
-        # Load scripts from the data file
-        with open(data_file_path, 'r', encoding='utf-8') as f:
-            scripts = json.load(f)
 
-        return jsonify({
+def load_data_file(data_file_path, stat=None):
+    """
+    Load scripts from a data file, using the in-memory cache.
+
+    The file is parsed only on first access or when its modification time
+    changes; otherwise the previously parsed entry is returned as is.
+    Successful responses of the data endpoints are serialized once here so
+    that handlers can return them without per-request serialization.
+
+    Args:
+        data_file_path: Path to the data file
+        stat: Result of os.stat() for the data file, if the caller already has it
+
+    Returns:
+        dict: Cache entry with 'mtime', 'scripts' (list of scripts),
+              'by_name' (mapping of script_name to script),
+              'list_response_bytes' (serialized scripts_list response),
+              'by_name_bytes' (mapping of script_name to serialized get_script response),
+              'list_response_encoded' (mapping of content encoding to the
+              compressed scripts_list response),
+              'etag' and 'last_modified' (HTTP validators for conditional requests)
+
+    Raises:
+        FileNotFoundError: If the data file does not exist
+        json.JSONDecodeError: If the data file contains invalid JSON
+    """
+    if stat is None:
+        stat = os.stat(data_file_path)
+    mtime = stat.st_mtime_ns
+    entry = _data_cache.get(data_file_path)
+    if entry is not None and entry['mtime'] == mtime:
+        return entry
+
+    with _data_cache_lock:
+        # Another thread may have reloaded the file while we were waiting
+        entry = _data_cache.get(data_file_path)
+        if entry is not None and entry['mtime'] == mtime:
+            return entry
+
+        # Parse the raw bytes, skipping the text decoding layer
+        with open(data_file_path, 'rb') as f:
+            scripts = json_loads(f.read())
+
+        # Index scripts by script_name; iterating in reverse keeps the
+        # first occurrence when a script_name is duplicated
+        by_name = {
+            script['script_name']: script
+            for script in reversed(scripts)
+            if 'script_name' in script
+        }
+
+        list_response_bytes = json_dumps({
             'success': True,
             'count': len(scripts),
             'scripts': scripts
         })
 
-    except json.JSONDecodeError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Invalid JSON format in data file: {str(e)}',
-            'scripts': []
-        }), 500
+        # Compress the scripts list once per load, best encoding first
+        list_response_encoded = {}
+        if BROTLI_AVAILABLE:
+            list_response_encoded['br'] = brotli.compress(list_response_bytes, quality=11)
+        list_response_encoded['gzip'] = gzip.compress(list_response_bytes, compresslevel=9)
+
+        entry = {
+            'mtime': mtime,
+            'scripts': scripts,
+            'by_name': by_name,
+            'list_response_bytes': list_response_bytes,
+            'list_response_encoded': list_response_encoded,
+            'by_name_bytes': {
+                name: json_dumps({'success': True, 'result': script})
+                for name, script in by_name.items()
+            },
+            'etag': f'{mtime:x}-{stat.st_size:x}',
+            'last_modified': stat.st_mtime
+        }
+        _data_cache[data_file_path] = entry
+
+    return entry
+
+
+def load_scripts(lang):
+    """
+    Load the cached data file entry for the specified language.
+    Falls back to default language (ru) if the requested language file doesn't
+    exist or its path can't be resolved (e.g. lang produces an invalid path).
+    Errors reading or parsing an existing file are not masked.
+
+    Args:
+        lang: Language code (e.g., 'ru', 'en')
+
+    Returns:
+        dict: Cache entry as returned by load_data_file()
+
+    Raises:
+        FileNotFoundError: If neither the requested nor the default data file exists
+    """
+    data_file_path, default_data_file_path = get_data_file_paths(lang)
+    # Only resolving the requested path may trigger the fallback; errors
+    # reading or parsing an existing file are reported to the client
+    try:
+        stat = os.stat(data_file_path)
     except PermissionError:
-        return jsonify({
-            'success': False,
-            'error': 'Permission denied accessing data file',
-            'scripts': []
-        }), 403
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'scripts': []
-        }), 500
+        raise
+    except (OSError, ValueError):
+        # Missing file, or a lang value that is not a valid file name
+        # (path separators, embedded null byte, name too long, ...)
+        if data_file_path == default_data_file_path:
+            raise
+        return load_data_file(default_data_file_path)
+    return load_data_file(data_file_path, stat)
+
+
+def handle_data_file_errors(empty_field, empty_value):
+    """
+    Decorator factory that turns data file errors into JSON error responses.
+
+    Keeps the data endpoints free of per-handler error handling while
+    preserving their response format on failure.
+
+    Args:
+        empty_field: Name of the payload field returned on error (e.g., 'scripts')
+        empty_value: Value of that field on error (e.g., [] or None)
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            except FileNotFoundError:
+                error, status = 'Data file not found', 404
+            except json.JSONDecodeError as e:
+                error, status = f'Invalid JSON format in data file: {str(e)}', 500
+            except PermissionError:
+                error, status = 'Permission denied accessing data file', 403
+            except Exception as e:
+                error, status = str(e), 500
+
+            return json_response({
+                'success': False,
+                'error': error,
+                empty_field: empty_value
+            }, status)
+        return decorated_function
+    return decorator
+
+
+@app.route('/api/scripts_list', methods=['GET'])
+@require_api_key
+@handle_data_file_errors('scripts', [])
+def scripts_list():
+    """
+    List all scripts from the data file.
+
+    Query Parameters:
+        lang: Language code for the data file (default: 'ru')
+              Falls back to 'ru' if the requested language file doesn't exist.
+
+    Returns:
+        JSON response with list of scripts and their details from the data file.
+    """
+    # Get language from query parameter, default to 'ru'
+    lang = request.args.get('lang', DEFAULT_LANG)
+
+    # Return the pre-serialized list of scripts from the cache, compressed
+    # if the client accepts it, or 304 Not Modified if the client already
+    # has this version
+    entry = load_scripts(lang)
+    encoding = request.accept_encodings.best_match(list(entry['list_response_encoded']))
+    if encoding:
+        response = json_response(entry['list_response_encoded'][encoding])
+        response.content_encoding = encoding
+        response.set_etag(f"{entry['etag']}-{encoding}")
+    else:
+        response = json_response(entry['list_response_bytes'])
+        response.set_etag(entry['etag'])
+    response.vary.add('Accept-Encoding')
+    response.last_modified = entry['last_modified']
+    return response.make_conditional(request)
 
 
 @app.route('/api/script/<script_name>', methods=['GET'])
 @require_api_key
+@handle_data_file_errors('result', None)
 def get_script(script_name):
     """
     Get information about a single script by its script_name.
@@ -500,57 +683,20 @@ def get_script(script_name):
     Returns:
         JSON response with script details if found, or 404 if not found.
     """
-    try:
-        # Get language from query parameter, default to 'ru'
-        lang = request.args.get('lang', DEFAULT_LANG)
-
-        # Get the appropriate data file path
-        data_file_path = get_data_file_path(lang)
+    # Get language from query parameter, default to 'ru'
+    lang = request.args.get('lang', DEFAULT_LANG)
 
-        if not os.path.exists(data_file_path):
-            return jsonify({
-                'success': False,
-                'error': 'Data file not found',
-                'result': None
-            }), 404
+    # Find the pre-serialized script by script_name in the cached index
+    body = load_scripts(lang)['by_name_bytes'].get(script_name)
+    if body is not None:
+        return json_response(body)
 
-        # Load scripts from the data file
-        with open(data_file_path, 'r', encoding='utf-8') as f:
-            scripts = json.load(f)
-
-        # Find the script by script_name
-        for script in scripts:
-            if script.get('script_name') == script_name:
-                return jsonify({
-                    'success': True,
-                    'result': script
-                })
-
-        # Script not found
-        return jsonify({
-            'success': False,
-            'error': f'Script with script_name "{script_name}" not found',
-            'result': None
-        }), 404
-
-    except json.JSONDecodeError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Invalid JSON format in data file: {str(e)}',
-            'result': None
-        }), 500
-    except PermissionError:
-        return jsonify({
-            'success': False,
-            'error': 'Permission denied accessing data file',
-            'result': None
-        }), 403
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'result': None
-        }), 500
+    # Script not found
+    return json_response({
+        'success': False,
+        'error': f'Script with script_name "{script_name}" not found',
+        'result': None
+    }, 404)
 
 
 def execute_script_via_ssh(server_ip, server_root_password, script_name, additional=None, port=SSH_DEFAULT_PORT, server_root_username='root'):
@@ -1165,6 +1311,13 @@ def get_request_stats():
     })
 
 
+# Health check response body, serialized once
+HEALTH_RESPONSE_BODY = json_dumps({
+    'status': 'healthy',
+    'message': 'API is running'
+})
+
+
 @app.route('/health', methods=['GET'])
 @require_api_key
 def health():
@@ -1174,10 +1327,35 @@ def health():
     Returns:
         JSON response indicating the API is running.
     """
-    return jsonify({
-        'status': 'healthy',
-        'message': 'API is running'
-    })
+    return json_response(HEALTH_RESPONSE_BODY)
+
+
+class HealthCheckMiddleware:
+    """
+    WSGI middleware that answers GET /health without going through Flask.
+
+    Health checks are polled frequently by monitoring systems, so the fixed
+    response is returned directly, skipping routing and request/response
+    objects. When API key authentication is enabled, requests are passed
+    on to the Flask endpoint so that the key is still checked.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if (not API_KEY
+                and environ.get('PATH_INFO') == '/health'
+                and environ.get('REQUEST_METHOD') == 'GET'):
+            start_response('200 OK', [
+                ('Content-Type', 'application/json'),
+                ('Content-Length', str(len(HEALTH_RESPONSE_BODY)))
+            ])
+            return [HEALTH_RESPONSE_BODY]
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = HealthCheckMiddleware(app.wsgi_app)
 
 
 @app.route('/', methods=['GET'])
@@ -1189,7 +1367,7 @@ def index():
     Returns:
         JSON response with API info and available endpoints.
     """
-    return jsonify({
+    return json_response({
         'name': 'Install Scripts API',
         'version': '1.2.0',
         'endpoints': {
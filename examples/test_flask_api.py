@@ -8,7 +8,10 @@ Run this script from the repository root directory.
 
 import os
 import sys
+import gzip
 import json
+import importlib.util
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -20,7 +23,8 @@ from app import (
     generate_task_id, get_task_file_path, write_task_status, read_task_status,
     delete_task_file, append_task_content, strip_ansi_codes,
     TASK_STATUS_PROCESSING, TASK_STATUS_COMPLETED, TASK_STATUS_ERROR,
-    TASKS_DIR, SSH_DEFAULT_PORT, build_remote_install_command, redact_secret
+    TASKS_DIR, SSH_DEFAULT_PORT, build_remote_install_command, redact_secret,
+    load_data_file, get_data_file_paths, BROTLI_AVAILABLE
 )
 
 
@@ -113,6 +117,45 @@ class TestFlaskAPI(unittest.TestCase):
         data = response.get_json()
         self.assertEqual(data['status'], 'healthy')
 
+    def test_health_middleware_answers_get_without_flask(self):
+        """Test that GET /health is answered by the middleware when API_KEY is empty."""
+        middleware = self.app.wsgi_app
+        with patch('app.API_KEY', ''), \
+                patch.object(middleware, 'wsgi_app', wraps=middleware.wsgi_app) as flask_wsgi_app:
+            response = self.client.get('/health')
+            flask_wsgi_app.assert_not_called()
+
+        expected_body = b'{"status":"healthy","message":"API is running"}'
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, expected_body)
+        self.assertEqual(response.headers['Content-Type'], 'application/json')
+        self.assertEqual(response.headers['Content-Length'], str(len(expected_body)))
+
+    def test_health_middleware_passes_other_methods_to_flask(self):
+        """Test that non-GET /health requests and other paths still go to Flask."""
+        middleware = self.app.wsgi_app
+        with patch('app.API_KEY', ''), \
+                patch.object(middleware, 'wsgi_app', wraps=middleware.wsgi_app) as flask_wsgi_app:
+            response = self.client.post('/health')
+            self.assertEqual(response.status_code, 405)
+            self.assertEqual(flask_wsgi_app.call_count, 1)
+
+            response = self.client.head('/health')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(flask_wsgi_app.call_count, 2)
+
+            response = self.client.get('/health/')
+            self.assertEqual(flask_wsgi_app.call_count, 3)
+
+    def test_health_endpoint_requires_api_key_when_set(self):
+        """Test that /health is still protected when API_KEY is set."""
+        with patch('app.API_KEY', 'secret'):
+            response = self.client.get('/health')
+            self.assertEqual(response.status_code, 401)
+            response = self.client.get('/health', headers={'X-API-Key': 'secret'})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['status'], 'healthy')
+
     def test_scripts_list_endpoint(self):
         """Test the scripts_list endpoint returns list of scripts."""
         response = self.client.get('/api/scripts_list')
@@ -142,6 +185,123 @@ class TestFlaskAPI(unittest.TestCase):
         for script_name in script_names:
             self.assertNotIn('.sh', script_name, f"Script name '{script_name}' should not contain extension")
 
+    def test_scripts_list_conditional_get(self):
+        """Test that scripts_list supports ETag and Last-Modified validators."""
+        response = self.client.get('/api/scripts_list')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get('ETag'))
+        self.assertIsNotNone(response.headers.get('Last-Modified'))
+
+        response = self.client.get('/api/scripts_list', headers={
+            'If-None-Match': response.headers['ETag']
+        })
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        response = self.client.get('/api/scripts_list', headers={
+            'If-None-Match': '"outdated"'
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.get_json()['success'])
+
+    def test_scripts_list_gzip_encoding(self):
+        """Test that scripts_list is served gzip-compressed when the client accepts it."""
+        plain = self.client.get('/api/scripts_list')
+        self.assertIsNone(plain.headers.get('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain.headers.get('Vary', ''))
+
+        response = self.client.get('/api/scripts_list', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get('Content-Encoding'), 'gzip')
+        self.assertIn('Accept-Encoding', response.headers.get('Vary', ''))
+        self.assertNotEqual(response.headers['ETag'], plain.headers['ETag'])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), plain.get_json())
+
+        response = self.client.get('/api/scripts_list', headers={
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': response.headers['ETag']
+        })
+        self.assertEqual(response.status_code, 304)
+
+    @unittest.skipUnless(BROTLI_AVAILABLE, 'brotli is not installed')
+    def test_scripts_list_brotli_encoding(self):
+        """Test that scripts_list prefers Brotli when the client accepts it."""
+        import brotli
+
+        plain = self.client.get('/api/scripts_list')
+
+        response = self.client.get('/api/scripts_list', headers={'Accept-Encoding': 'br, gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get('Content-Encoding'), 'br')
+        self.assertIn('Accept-Encoding', response.headers.get('Vary', ''))
+        self.assertEqual(response.headers['ETag'], plain.headers['ETag'][:-1] + '-br"')
+        self.assertEqual(json.loads(brotli.decompress(response.data)), plain.get_json())
+
+        response = self.client.get('/api/scripts_list', headers={
+            'Accept-Encoding': 'br, gzip',
+            'If-None-Match': response.headers['ETag']
+        })
+        self.assertEqual(response.status_code, 304)
+
+    def test_scripts_list_unknown_lang_falls_back(self):
+        """Test that an unknown lang falls back to the default data file."""
+        response = self.client.get('/api/scripts_list?lang=xx')
+        self.assertEqual(response.status_code, 200)
+        default_data = self.client.get('/api/scripts_list').get_json()
+        self.assertEqual(response.get_json(), default_data)
+
+    def test_data_endpoints_invalid_lang_path_falls_back(self):
+        """Test that lang values producing invalid file paths fall back to the default data file."""
+        default_list = self.client.get('/api/scripts_list').get_json()
+        default_script = self.client.get('/api/script/n8n').get_json()
+        for lang in ('ru.json/x', '%00', 'a' * 300):
+            response = self.client.get(f'/api/scripts_list?lang={lang}')
+            self.assertEqual(response.status_code, 200, lang)
+            self.assertEqual(response.get_json(), default_list)
+
+            response = self.client.get(f'/api/script/n8n?lang={lang}')
+            self.assertEqual(response.status_code, 200, lang)
+            self.assertEqual(response.get_json(), default_script)
+
+    def test_scripts_list_data_file_not_found(self):
+        """Test that scripts_list returns 404 when no data file exists."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch('app.DATA_DIR', tmp_dir):
+                get_data_file_paths.cache_clear()
+                try:
+                    response = self.client.get('/api/scripts_list?lang=en')
+                finally:
+                    get_data_file_paths.cache_clear()
+        self.assertEqual(response.status_code, 404)
+        data = response.get_json()
+        self.assertFalse(data['success'])
+        self.assertEqual(data['scripts'], [])
+
+    def test_data_endpoints_invalid_json(self):
+        """Test that data endpoints return 500 with their error format for invalid JSON."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'data_ru.json'), 'w', encoding='utf-8') as f:
+                f.write('[{"name": ')
+            with patch('app.DATA_DIR', tmp_dir):
+                get_data_file_paths.cache_clear()
+                try:
+                    list_response = self.client.get('/api/scripts_list')
+                    script_response = self.client.get('/api/script/various-useful-api-django')
+                finally:
+                    get_data_file_paths.cache_clear()
+
+        self.assertEqual(list_response.status_code, 500)
+        data = list_response.get_json()
+        self.assertFalse(data['success'])
+        self.assertIn('Invalid JSON format', data['error'])
+        self.assertEqual(data['scripts'], [])
+
+        self.assertEqual(script_response.status_code, 500)
+        data = script_response.get_json()
+        self.assertFalse(data['success'])
+        self.assertIn('Invalid JSON format', data['error'])
+        self.assertIsNone(data['result'])
+
     def test_get_script_endpoint(self):
         """Test the /api/script/<script_name> endpoint returns script info."""
         response = self.client.get('/api/script/various-useful-api-django')
@@ -196,6 +356,184 @@ class TestFlaskAPI(unittest.TestCase):
             self.assertEqual(script_data['result']['script_name'], script_name)
 
 
+class TestDataFileCache(unittest.TestCase):
+    """Test cases for the in-memory data file cache."""
+
+    def setUp(self):
+        """Create a temporary data file."""
+        fd, self.data_file = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump([{'name': 'One', 'script_name': 'one'}], f)
+
+    def tearDown(self):
+        """Remove the temporary data file."""
+        os.remove(self.data_file)
+
+    def test_load_data_file_builds_index(self):
+        """Test that scripts are indexed by script_name."""
+        entry = load_data_file(self.data_file)
+        self.assertEqual(len(entry['scripts']), 1)
+        self.assertEqual(entry['by_name']['one']['name'], 'One')
+
+    def test_load_data_file_index_keeps_first_duplicate(self):
+        """Test that the index resolves duplicates like the former linear scan."""
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {'name': 'First', 'script_name': 'dup'},
+                {'name': 'Second', 'script_name': 'dup'}
+            ], f)
+        mtime = os.stat(self.data_file).st_mtime_ns + 1_000_000_000
+        os.utime(self.data_file, ns=(mtime, mtime))
+
+        entry = load_data_file(self.data_file)
+        self.assertEqual(entry['by_name']['dup']['name'], 'First')
+        self.assertEqual(json.loads(entry['by_name_bytes']['dup'])['result']['name'], 'First')
+
+    def test_load_data_file_pre_serializes_responses(self):
+        """Test that endpoint responses are serialized at load time."""
+        entry = load_data_file(self.data_file)
+        self.assertEqual(json.loads(entry['list_response_bytes']), {
+            'success': True,
+            'count': 1,
+            'scripts': entry['scripts']
+        })
+        self.assertEqual(json.loads(entry['by_name_bytes']['one']), {
+            'success': True,
+            'result': entry['by_name']['one']
+        })
+
+    def test_load_data_file_uses_cache(self):
+        """Test that an unchanged file is not parsed again."""
+        entry1 = load_data_file(self.data_file)
+        with patch('app.json_loads') as mock_load:
+            entry2 = load_data_file(self.data_file)
+            mock_load.assert_not_called()
+        self.assertIs(entry1, entry2)
+
+    def test_load_data_file_reloads_on_change(self):
+        """Test that the cache is invalidated when the file is modified."""
+        load_data_file(self.data_file)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump([{'name': 'Two', 'script_name': 'two'}], f)
+        mtime = os.stat(self.data_file).st_mtime_ns + 1_000_000_000
+        os.utime(self.data_file, ns=(mtime, mtime))
+
+        entry = load_data_file(self.data_file)
+        self.assertIn('two', entry['by_name'])
+        self.assertNotIn('one', entry['by_name'])
+
+    def test_load_data_file_invalid_json(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write('[{"name": ')
+        mtime = os.stat(self.data_file).st_mtime_ns + 1_000_000_000
+        os.utime(self.data_file, ns=(mtime, mtime))
+
+        with self.assertRaises(json.JSONDecodeError):
+            load_data_file(self.data_file)
+
+    def test_load_data_file_not_found(self):
+        """Test that a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            load_data_file(self.data_file + '.missing')
+
+
+def load_app_module_without(*blocked_modules):
+    """
+    Import a separate copy of the app module with the given modules blocked.
+
+    Used to exercise the JSON library fallbacks chosen at import time.
+    """
+    app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api', 'app.py')
+    spec = importlib.util.spec_from_file_location('app_without_' + '_'.join(blocked_modules), app_path)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {name: None for name in blocked_modules}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonLibraryFallback(unittest.TestCase):
+    """Test cases for the ujson and standard json fallbacks of json_dumps/json_loads."""
+
+    def setUp(self):
+        """Set up test client for the default (orjson) app."""
+        app.config['TESTING'] = True
+        self.client = app.test_client()
+
+    def assert_matches_default_app(self, module):
+        """Assert that the data endpoints of module return the same JSON as the default app."""
+        module.app.config['TESTING'] = True
+        client = module.app.test_client()
+        for url in ('/api/scripts_list', '/api/scripts_list?lang=en',
+                    '/api/script/n8n', '/api/script/n8n?lang=en',
+                    '/api/script/non-existent-script', '/health'):
+            expected = self.client.get(url)
+            response = client.get(url)
+            self.assertEqual(response.status_code, expected.status_code, url)
+            self.assertEqual(response.get_json(), expected.get_json(), url)
+
+    def assert_invalid_json_response(self, module):
+        """Assert that an invalid data file gives the 500 'Invalid JSON format' response."""
+        client = module.app.test_client()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'data_ru.json'), 'w', encoding='utf-8') as f:
+                f.write('[{"name": ')
+            with patch.object(module, 'DATA_DIR', tmp_dir):
+                module.get_data_file_paths.cache_clear()
+                try:
+                    list_response = client.get('/api/scripts_list')
+                    script_response = client.get('/api/script/n8n')
+                finally:
+                    module.get_data_file_paths.cache_clear()
+
+        for response in (list_response, script_response):
+            self.assertEqual(response.status_code, 500)
+            self.assertIn('Invalid JSON format', response.get_json()['error'])
+
+    def test_stdlib_json_fallback(self):
+        """Test the standard json module fallback when orjson and ujson are unavailable."""
+        module = load_app_module_without('orjson', 'ujson')
+        self.assertIsNone(module.orjson)
+        self.assertIsNone(module.ujson)
+        self.assertEqual(module.json_loads(b'[1]'), [1])
+        self.assertEqual(module.json_dumps({'a': 'é/'}), '{"a":"é/"}'.encode('utf-8'))
+        self.assert_matches_default_app(module)
+        self.assert_invalid_json_response(module)
+
+    def test_stdlib_json_fallback_non_utf8_file_is_not_masked(self):
+        """Test that a non-UTF-8 requested data file gives the same 500 response as with orjson."""
+        module = load_app_module_without('orjson', 'ujson')
+        client = module.app.test_client()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'data_ru.json'), 'w', encoding='utf-8') as f:
+                json.dump([{'name': 'Ru', 'script_name': 'ru-script'}], f)
+            with open(os.path.join(tmp_dir, 'data_en.json'), 'wb') as f:
+                f.write('[{"name": "Caf\u00e9", "script_name": "en-script"}]'.encode('latin-1'))
+            with patch.object(module, 'DATA_DIR', tmp_dir):
+                module.get_data_file_paths.cache_clear()
+                try:
+                    list_response = client.get('/api/scripts_list?lang=en')
+                    script_response = client.get('/api/script/ru-script?lang=en')
+                finally:
+                    module.get_data_file_paths.cache_clear()
+
+        for response in (list_response, script_response):
+            self.assertEqual(response.status_code, 500)
+            self.assertFalse(response.get_json()['success'])
+            self.assertIn('Invalid JSON format', response.get_json()['error'])
+
+    @unittest.skipUnless(importlib.util.find_spec('ujson'), 'ujson is not installed')
+    def test_ujson_fallback(self):
+        """Test the ujson fallback when orjson is unavailable."""
+        module = load_app_module_without('orjson')
+        self.assertIsNone(module.orjson)
+        self.assertIsNotNone(module.ujson)
+        self.assertEqual(module.json_loads(b'[1]'), [1])
+        self.assertEqual(module.json_dumps({'a': 'é/'}), '{"a":"é/"}'.encode('utf-8'))
+        self.assert_matches_default_app(module)
+        self.assert_invalid_json_response(module)
+
+
 class TestInstallEndpoint(unittest.TestCase):
     """Test cases for the /api/install endpoint."""
 
@@ -845,6 +1183,20 @@ class TestStripAnsiCodes(unittest.TestCase):
         # Delete (\\x7f)
         self.assertEqual(strip_ansi_codes("Text\x7fhere"), "Texthere")
 
+    def test_strip_control_character_runs_before_escape(self):
+        """Test that a run of control characters does not swallow a following escape sequence."""
+        self.assertEqual(strip_ansi_codes("A\x00\x00\x1b[31mB\x1b[0m"), "AB")
+        self.assertEqual(strip_ansi_codes("Stray\x1b escape"), "Stray escape")
+
+    def test_preserve_literal_caret_bracket(self):
+        """Test that literal caret-bracket text such as regexes is not treated as an escape."""
+        self.assertEqual(strip_ansi_codes('^[A-Z]'), '^[A-Z]')
+        self.assertEqual(
+            strip_ansi_codes("grep -E '^[A-Z]+$' file"),
+            "grep -E '^[A-Z]+$' file"
+        )
+        self.assertEqual(strip_ansi_codes('^[[0;32mOK^[[0m ^[a-z]'), 'OK ^[a-z]')
+
     def test_preserve_tabs_and_newlines(self):
         """Test that tabs (\\x09) and newlines (\\x0a) are preserved."""
         self.assertEqual(strip_ansi_codes("Line1\nLine2"), "Line1\nLine2")
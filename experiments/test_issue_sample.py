@@ -3,10 +3,11 @@
 Test the exact sample from the issue comment.
 """
 
+import os
 import sys
-sys.path.insert(0, '/tmp/gh-issue-solver-1766688687154/api')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api'))
 
-from app import strip_ansi_codes
+from ansi_codes import strip_ansi_codes
 import json
 
 # This is exactly what was provided in the issue comment (the "result" field content)
@@ -7,10 +7,11 @@ and tests the strip_ansi_codes function.
 """
 
 import re
+import os
 import sys
-sys.path.insert(0, '/tmp/gh-issue-solver-1766688687154/api')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api'))
 
-from app import strip_ansi_codes
+from ansi_codes import strip_ansi_codes
 
 # Test data from the issue comment
 # The issue shows escape sequences like "\^[[0;36m" which is caret notation
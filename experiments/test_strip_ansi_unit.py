@@ -9,12 +9,13 @@ These tests verify that the function correctly removes:
 4. Control characters and their caret notation (^@, ^A, etc.)
 """
 
+import os
 import sys
 import unittest
 
-sys.path.insert(0, '/tmp/gh-issue-solver-1766688687154/api')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'api'))
 
-from app import strip_ansi_codes
+from ansi_codes import strip_ansi_codes
 
 
 class TestStripAnsiCodes(unittest.TestCase):
@@ -329,6 +329,8 @@ ExecStart=$VENV_DIR/bin/gunicorn \\
           --error-logfile '$INSTALL_DIR/gunicorn-errors.txt' \\
           --timeout 120 \\
           --workers 3 \\
+          --worker-class gthread \\
+          --threads 4 \\
           --bind unix:$SOCKET_PATH \\
           app:app
 